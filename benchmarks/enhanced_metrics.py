@@ -1,6 +1,5 @@
 """Enhanced metrics for comprehensive benchmark analysis."""
 
-import hashlib
 from collections import Counter, defaultdict
 from typing import Any
 
@@ -17,52 +16,7 @@ class EnhancedMetricsAnalyzer:
         Returns:
             Dictionary with duplication metrics
         """
-        post_ids = []
-        content_hashes = []
-        duplicate_count = 0
-        unique_posts = set()
-        posts_by_id = defaultdict(list)
-
-        for item in items:
-            # Get post ID if available
-            post_id = item.get("post_id") or item.get("id")
-            if post_id:
-                post_ids.append(post_id)
-                posts_by_id[post_id].append(item)
-
-            # Create content hash for deduplication
-            text = item.get("text", "")
-            if text:
-                content_hash = hashlib.md5(text.encode()).hexdigest()
-                if content_hash in unique_posts:
-                    duplicate_count += 1
-                else:
-                    unique_posts.add(content_hash)
-                content_hashes.append(content_hash)
-
-        # Calculate duplication metrics
-        total_posts = len(post_ids)
-        unique_post_ids = len(set(post_ids))
-        unique_content = len(unique_posts)
-
-        # Find posts that appear multiple times
-        duplicate_ids = {pid: count for pid, count in Counter(post_ids).items() if count > 1}
-
-        return {
-            "total_posts": total_posts,
-            "unique_post_ids": unique_post_ids,
-            "unique_content_hashes": unique_content,
-            "duplicate_count": duplicate_count,
-            "duplication_rate": duplicate_count / total_posts if total_posts > 0 else 0,
-            "id_duplication_rate": (total_posts - unique_post_ids) / total_posts
-            if total_posts > 0
-            else 0,
-            "content_duplication_rate": (total_posts - unique_content) / total_posts
-            if total_posts > 0
-            else 0,
-            "duplicate_id_count": len(duplicate_ids),
-            "max_duplications": max(Counter(post_ids).values()) if post_ids else 0,
-        }
+        return self._analyze_all(items)["duplication"]
 
     def analyze_author_coverage(self, items: list[dict]) -> dict[str, Any]:
         """Analyze author extraction coverage.
@@ -73,31 +27,7 @@ class EnhancedMetricsAnalyzer:
         Returns:
             Dictionary with author coverage metrics
         """
-        posts_with_authors = 0
-        unique_authors = set()
-        null_authors = 0
-        author_post_counts = Counter()
-
-        for item in items:
-            author = item.get("author")
-            if author is not None:
-                posts_with_authors += 1
-                unique_authors.add(author)
-                author_post_counts[author] += 1
-            else:
-                null_authors += 1
-
-        total = len(items)
-
-        return {
-            "posts_with_authors": posts_with_authors,
-            "posts_without_authors": null_authors,
-            "author_coverage_rate": posts_with_authors / total if total > 0 else 0,
-            "unique_authors": len(unique_authors),
-            "avg_posts_per_author": posts_with_authors / len(unique_authors)
-            if unique_authors
-            else 0,
-        }
+        return self._analyze_all(items)["authors"]
 
     def analyze_crawl_behavior(self, items: list[dict]) -> dict[str, Any]:
         """Analyze crawl behavior and strategy.
@@ -108,29 +38,116 @@ class EnhancedMetricsAnalyzer:
         Returns:
             Dictionary with crawl behavior metrics
         """
-        threads = defaultdict(list)
+        return self._analyze_all(items)["crawl"]
+
+    def _analyze_all(self, items: list[dict]) -> dict[str, Any]:
+        """Compute duplication, author and crawl metrics in one pass over items.
+
+        Args:
+            items: List of collected items
+
+        Returns:
+            Dictionary with "duplication", "authors" and "crawl" metric blocks
+        """
+        # Duplication state
+        texts_seen = 0
+        total_posts = 0
+        unique_posts: set[int] = set()
+        posts_by_id = defaultdict(list)
+
+        # Author coverage state; unique authors are just the Counter's keys,
+        # so no separate set is kept
+        posts_with_authors = 0
+        null_authors = 0
+        author_post_counts = Counter()
+
+        # Crawl behavior state; only per-thread counts are ever read, so store
+        # integers instead of lists of items
+        threads: Counter[str] = Counter()
         pages = set()
 
+        # Hoist bound methods out of the loop; attribute lookups on every
+        # iteration are a measurable share of a dict-heavy Python loop
+        unique_posts_add = unique_posts.add
+        pages_add = pages.add
+
         for item in items:
-            # Track threads
-            thread_url = item.get("thread_url") or item.get("url", "")
+            # Fetch each field once per item through a single bound .get
+            get = item.get
+            post_id = get("post_id") or get("id")
+            text = get("text", "")
+            author = get("author")
+            url = get("url", "")
+            thread_url = get("thread_url") or url
+
+            if post_id:
+                total_posts += 1
+                posts_by_id[post_id].append(item)
+
+            # Hash content for deduplication; set membership only needs a fast
+            # non-cryptographic hash, not MD5
+            if text:
+                texts_seen += 1
+                unique_posts_add(hash(text))
+
+            if author is not None:
+                posts_with_authors += 1
+                author_post_counts[author] += 1
+            else:
+                null_authors += 1
+
             if "/threads/" in thread_url:
                 thread_id = thread_url.split("/threads/")[1].split("/")[0]
-                threads[thread_id].append(item)
+                threads[thread_id] += 1
 
-            # Track pages
-            url = item.get("url", "")
             if url:
-                pages.add(url)
+                pages_add(url)
 
-        thread_depths = [len(posts) for posts in threads.values()]
+        # Calculate duplication metrics in a single pass over the per-id groups
+        counts = [len(posts) for posts in posts_by_id.values()]
+        unique_post_ids = len(posts_by_id)
+        unique_content = len(unique_posts)
+        duplicate_count = texts_seen - unique_content
+        duplicate_id_count = sum(1 for count in counts if count > 1)
+        max_duplications = max(counts, default=0)
+
+        total = len(items)
+        thread_depths = threads.values()
 
         return {
-            "unique_threads": len(threads),
-            "unique_pages": len(pages),
-            "avg_thread_depth": sum(thread_depths) / len(thread_depths) if thread_depths else 0,
-            "min_thread_depth": min(thread_depths) if thread_depths else 0,
-            "max_thread_depth": max(thread_depths) if thread_depths else 0,
+            "duplication": {
+                "total_posts": total_posts,
+                "unique_post_ids": unique_post_ids,
+                "unique_content_hashes": unique_content,
+                "duplicate_count": duplicate_count,
+                "duplication_rate": duplicate_count / total_posts if total_posts > 0 else 0,
+                "id_duplication_rate": (total_posts - unique_post_ids) / total_posts
+                if total_posts > 0
+                else 0,
+                "content_duplication_rate": (total_posts - unique_content) / total_posts
+                if total_posts > 0
+                else 0,
+                "duplicate_id_count": duplicate_id_count,
+                "max_duplications": max_duplications,
+            },
+            "authors": {
+                "posts_with_authors": posts_with_authors,
+                "posts_without_authors": null_authors,
+                "author_coverage_rate": posts_with_authors / total if total > 0 else 0,
+                "unique_authors": len(author_post_counts),
+                "avg_posts_per_author": posts_with_authors / len(author_post_counts)
+                if author_post_counts
+                else 0,
+            },
+            "crawl": {
+                "unique_threads": len(threads),
+                "unique_pages": len(pages),
+                "avg_thread_depth": sum(thread_depths) / len(thread_depths)
+                if thread_depths
+                else 0,
+                "min_thread_depth": min(thread_depths) if thread_depths else 0,
+                "max_thread_depth": max(thread_depths) if thread_depths else 0,
+            },
         }
 
     def calculate_all_metrics(self, items: list[dict]) -> dict[str, Any]:
@@ -145,8 +162,4 @@ class EnhancedMetricsAnalyzer:
         if not items:
             return {}
 
-        return {
-            "duplication": self.analyze_duplication(items),
-            "authors": self.analyze_author_coverage(items),
-            "crawl": self.analyze_crawl_behavior(items),
-        }
+        return self._analyze_all(items)
@@ -1,4 +1,6 @@
+import threading
 import time
+from collections import deque
 
 import psutil
 from pydantic import BaseModel
@@ -7,6 +9,14 @@ BYTES_PER_KB = 1024
 BYTES_PER_MB = BYTES_PER_KB * BYTES_PER_KB
 TIMESTAMP_FORMAT_HUMAN = "%Y-%m-%d %H:%M:%S"
 
+SAMPLE_INTERVAL_SECONDS = 0.5
+CHILD_REFRESH_EVERY_SAMPLES = 10
+
+# Sized for the runner's default 300 s timeout at the sample interval, with
+# slack for runs that override the timeout; deque(maxlen=...) keeps sample
+# insertion O(1) and bounds memory by dropping the oldest samples on overflow
+SAMPLE_CAPACITY = int(300 / SAMPLE_INTERVAL_SECONDS) + 64
+
 
 class BenchmarkMetrics(BaseModel):
     total_runtime_seconds: float
@@ -23,7 +33,11 @@ class BenchmarkMetrics(BaseModel):
 
 
 class MetricsCollector:
-    """Collect metrics during scraper execution."""
+    """Collect metrics during scraper execution.
+
+    Resource sampling runs on a background daemon thread so the benchmark
+    loop being measured never pays for memory_info()/children() walks.
+    """
 
     def __init__(self, collector_name: str, scenario_name: str) -> None:
         self.collector_name: str = collector_name
@@ -32,19 +46,33 @@ class MetricsCollector:
         self._start_time: float | None = None
         self._target_process: psutil.Process | None = None
         self._peak_memory: float = 0.0
-        self._cpu_samples: list[float] = []
+        self._cpu_samples: deque[float] = deque(maxlen=SAMPLE_CAPACITY)
+        self._children: list[psutil.Process] = []
+        self._sample_count: int = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler: threading.Thread | None = None
 
     def start(self) -> None:
         """Start collecting metrics."""
-        self._start_time = time.time()
+        # Monotonic clock: wall-clock adjustments must not skew the runtime
+        self._start_time = time.perf_counter()
 
     def attach_to_process(self, process_id: int) -> None:
-        """Attach to subprocess for monitoring."""
+        """Attach to subprocess for monitoring and start the sampler thread."""
         try:
             self._target_process = psutil.Process(process_id)
             _ = self._target_process.cpu_percent(None)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+            return
+
+        self._sampler = threading.Thread(target=self._run_sampler, daemon=True)
+        self._sampler.start()
+
+    def _run_sampler(self) -> None:
+        """Sample resources at a coarse interval until stopped."""
+        while not self._stop_event.wait(SAMPLE_INTERVAL_SECONDS):
+            self.sample()
 
     def sample(self) -> None:
         """Sample resource usage."""
@@ -52,24 +80,33 @@ class MetricsCollector:
             return
 
         try:
-            rss: int = int(self._target_process.memory_info().rss)  # pyright: ignore[reportAny]
+            # oneshot() batches the /proc reads behind memory_info() and
+            # cpu_percent() into one pass per sample
+            with self._target_process.oneshot():
+                rss: int = int(self._target_process.memory_info().rss)  # pyright: ignore[reportAny]
+                cpu = self._target_process.cpu_percent(None)
             memory_mb: float = float(rss / BYTES_PER_MB)
 
-            try:
-                for child in self._target_process.children(recursive=True):
-                    try:
-                        child_rss: int = int(child.memory_info().rss)  # pyright: ignore[reportAny]
-                        memory_mb += float(child_rss / BYTES_PER_MB)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-            self._peak_memory = max(self._peak_memory, memory_mb)
-
-            cpu = self._target_process.cpu_percent(None)
-            if cpu and cpu > 0:
-                self._cpu_samples.append(cpu)
+            # The recursive children() walk is expensive on deep process
+            # trees, so refresh the list only every few samples
+            if self._sample_count % CHILD_REFRESH_EVERY_SAMPLES == 0:
+                try:
+                    self._children = list(self._target_process.children(recursive=True))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._children = []
+            self._sample_count += 1
+
+            for child in self._children:
+                try:
+                    child_rss: int = int(child.memory_info().rss)  # pyright: ignore[reportAny]
+                    memory_mb += float(child_rss / BYTES_PER_MB)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+            with self._lock:
+                self._peak_memory = max(self._peak_memory, memory_mb)
+                if cpu and cpu > 0:
+                    self._cpu_samples.append(cpu)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
 
@@ -78,16 +115,22 @@ class MetricsCollector:
         if self._start_time is None:
             raise RuntimeError("Metrics never started")
 
-        runtime = time.time() - self._start_time
+        runtime = time.perf_counter() - self._start_time
+
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=SAMPLE_INTERVAL_SECONDS * 2)
+
+        with self._lock:
+            peak_memory = self._peak_memory
+            cpu_samples = list(self._cpu_samples)
 
         return BenchmarkMetrics(
             total_runtime_seconds=runtime,
             items_extracted=items_count,
             items_per_second=items_count / runtime if runtime > 0 else 0.0,
-            peak_memory_mb=self._peak_memory,
-            avg_cpu_percent=sum(self._cpu_samples) / len(self._cpu_samples)
-            if self._cpu_samples
-            else 0.0,
+            peak_memory_mb=peak_memory,
+            avg_cpu_percent=sum(cpu_samples) / len(cpu_samples) if cpu_samples else 0.0,
             success=success,
             collector_name=self.collector_name,
             scenario_name=self.scenario_name,
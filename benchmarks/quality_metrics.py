@@ -1,11 +1,14 @@
 """Universal quality metrics calculation for benchmark results."""
 
-import json
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, cast
-from urllib.parse import ParseResult, urlparse
+from statistics import quantiles
+from typing import Any
+
+import orjson
 
 JsonItem = dict[str, Any]
 
@@ -64,6 +67,59 @@ THREAD_ID_PATTERNS = [
     r"/discussion/(\d+)",
 ]
 
+# Frozen sets for C-level dict-key intersection in the per-item field scans
+TEXT_FIELDS_SET = frozenset(TEXT_FIELDS)
+ID_FIELDS_SET = frozenset(ID_FIELDS)
+AUTHOR_FIELDS_SET = frozenset(AUTHOR_FIELDS)
+DATE_FIELDS_SET = frozenset(DATE_FIELDS)
+
+# Compiled alternation so each URL is scanned once instead of once per pattern
+THREAD_ID_RE = re.compile("|".join(f"(?:{pattern})" for pattern in THREAD_ID_PATTERNS))
+
+# Host extraction without the full 6-field ParseResult that urlparse builds
+HOST_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://([^/?#]+)")
+
+# Multi-pattern alternation so one scan over the URL flags all patterns
+URL_PATTERN_RE = re.compile(r"/threads/|/post-|/page-|page=")
+
+
+# Parsed-file cache keyed by (path, mtime_ns, size) so repeated analysis of
+# unchanged files skips re-reading and re-parsing entirely
+_FILE_CACHE_MAX_ENTRIES = 32
+_file_cache: dict[tuple[str, int, int], list[JsonItem]] = {}
+
+
+@lru_cache(maxsize=1 << 16)
+def _url_facts(url: str) -> tuple[str | None, str | None, bool, bool, bool]:
+    """Compute (host, thread_id, has_thread, has_post, has_pagination) for a URL.
+
+    Crawl outputs repeat the same URLs heavily (one thread_url per post), so
+    the regex and substring work is memoized per unique URL.
+    """
+    host_match = HOST_RE.match(url)
+    thread_match = THREAD_ID_RE.search(url)
+    thread_id = None
+    if thread_match:
+        thread_id = next(group for group in thread_match.groups() if group)
+
+    has_thread = has_post = has_page = False
+    for pattern_match in URL_PATTERN_RE.finditer(url):
+        token = pattern_match.group()
+        if token == "/threads/":
+            has_thread = True
+        elif token == "/post-":
+            has_post = True
+        else:
+            has_page = True
+
+    return (
+        host_match.group(1) if host_match else None,
+        thread_id,
+        has_thread,
+        has_post,
+        has_page,
+    )
+
 
 class MetricsAnalyzer:
     """Analyzes JSONL output files to calculate universal quality metrics."""
@@ -75,25 +131,27 @@ class MetricsAnalyzer:
 
     def calculate_all_metrics(self) -> dict[str, Any]:
         """Calculate all available metrics from the output files."""
-        # collect all items from all files
+        # collect all items from all files; only jsonl files, skip single JSON
+        jsonl_files = [
+            file_path
+            for file_path in self.output_files
+            if file_path.suffix == ".jsonl" and file_path.exists()
+        ]
+
         all_items: list[JsonItem] = []
         file_stats: dict[str, dict[str, Any]] = {}
 
-        for file_path in self.output_files:
-            if not file_path.exists():
-                continue
-
-            # only process jsonl files, skip single JSON files
-            if file_path.suffix != ".jsonl":
-                continue
-
-            items = self._load_jsonl(file_path)
-            if items:
-                all_items.extend(items)
-                file_stats[file_path.name] = {
-                    "count": len(items),
-                    "file_type": self._guess_file_type(file_path.name, items),
-                }
+        if jsonl_files:
+            # load files concurrently: reads overlap and orjson parsing
+            # releases the GIL for large buffers
+            with ThreadPoolExecutor(max_workers=min(8, len(jsonl_files))) as pool:
+                for file_path, items in zip(jsonl_files, pool.map(self.load_jsonl, jsonl_files)):
+                    if items:
+                        all_items.extend(items)
+                        file_stats[file_path.name] = {
+                            "count": len(items),
+                            "file_type": self._guess_file_type(file_path.name, items),
+                        }
 
         if not all_items:
             return self.metrics
@@ -101,28 +159,63 @@ class MetricsAnalyzer:
         self.metrics["total_items"] = len(all_items)
         self.metrics["files_analyzed"] = len(file_stats)
 
-        self._analyze_text_content(all_items)
-        self._analyze_urls(all_items)
-        self._analyze_identifiers(all_items)
-        self._analyze_authors(all_items)
-        self._analyze_threads(all_items)
-        self._analyze_temporal_data(all_items)
+        # Extract the analyzed fields once into parallel columns; each
+        # analyzer then walks plain lists instead of re-probing item dicts
+        columns = self._extract_columns(all_items)
+
+        self._analyze_text_content(columns)
+        self._analyze_urls(columns)
+        self._analyze_identifiers(columns)
+        self._analyze_authors(columns)
+        self._analyze_threads(columns)
+        self._analyze_temporal_data(columns)
 
         return self.metrics
 
-    def _load_jsonl(self, file_path: Path) -> list[JsonItem]:
-        """Load all items from a JSONL file."""
-        items: list[JsonItem] = []
+    def load_jsonl(self, file_path: Path) -> list[JsonItem]:
+        """Load all items from a JSONL file, reusing cached parses."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        item = json.loads(line)
-                        items.append(item)
-                    except json.JSONDecodeError:
-                        continue
+            stat = file_path.stat()
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+            cached = _file_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # One read + one byte-level split instead of readlines(); the
+            # whole buffer is needed anyway and split is a single C-level
+            # newline scan
+            with open(file_path, "rb") as f:
+                lines = f.read().split(b"\n")
         except Exception:
+            return []
+
+        if lines and not lines[-1]:
+            lines.pop()
+
+        items = self._parse_jsonl_lines(lines)
+
+        if len(_file_cache) >= _FILE_CACHE_MAX_ENTRIES:
+            _file_cache.pop(next(iter(_file_cache)))
+        _file_cache[cache_key] = items
+
+        return items
+
+    @staticmethod
+    def _parse_jsonl_lines(lines: list[bytes]) -> list[JsonItem]:
+        """Parse JSONL lines, skipping malformed ones."""
+        # Parse the whole file optimistically; only fall back to per-line
+        # error handling when a malformed line is actually present
+        try:
+            return [orjson.loads(line) for line in lines]
+        except orjson.JSONDecodeError:
             pass
+
+        items: list[JsonItem] = []
+        for line in lines:
+            try:
+                items.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue
         return items
 
     def _guess_file_type(self, filename: str, items: list[JsonItem]) -> str:
@@ -147,16 +240,38 @@ class MetricsAnalyzer:
 
         return "unknown"
 
-    def _analyze_text_content(self, items: list[JsonItem]) -> None:
+    def _extract_columns(self, items: list[JsonItem]) -> dict[str, Any]:
+        """Materialize the analyzed fields as parallel columns (SoA layout)."""
+        return {
+            "count": len(items),
+            "text": [self._extract_text(item) for item in items],
+            "is_post": [("thread_url" in item or "post_id" in item) for item in items],
+            "url": [item.get("url") for item in items],
+            "thread_url": [item.get("thread_url") for item in items],
+            "field_urls": [
+                value
+                for item in items
+                for value in map(item.get, URL_FIELDS)
+                if type(value) is str
+            ],
+            "id": [self._extract_id(item) for item in items],
+            "author": [self._extract_author(item) for item in items],
+            "thread_id_fallback": [
+                item.get("thread_id") or item.get("topic_id") for item in items
+            ],
+            "has_date": [self._has_date(item) for item in items],
+        }
+
+    def _analyze_text_content(self, columns: dict[str, Any]) -> None:
         """Analyze text content across all items."""
+        count = columns["count"]
         items_with_text = 0
         items_with_nontrivial_text = 0
         text_lengths: list[int] = []
         text_lengths_by_type: dict[str, list[int]] = defaultdict(list)
         total_text_length = 0
 
-        for item in items:
-            text = self._extract_text(item, TEXT_FIELDS)
+        for text, is_post, url in zip(columns["text"], columns["is_post"], columns["url"]):
             if text:
                 items_with_text += 1
                 text_len = len(text)
@@ -167,15 +282,15 @@ class MetricsAnalyzer:
                     items_with_nontrivial_text += 1
 
                 # track by type
-                if "thread_url" in item or "post_id" in item:
+                if is_post:
                     text_lengths_by_type["posts"].append(text_len)
-                elif "url" in item:
+                elif url is not None:
                     text_lengths_by_type["pages"].append(text_len)
 
         if items_with_text > 0:
             self.metrics["items_with_text"] = items_with_text
-            self.metrics["items_missing_text"] = len(items) - items_with_text
-            self.metrics["non_trivial_text_rate"] = items_with_nontrivial_text / len(items)
+            self.metrics["items_missing_text"] = count - items_with_text
+            self.metrics["non_trivial_text_rate"] = items_with_nontrivial_text / count
             self.metrics["avg_text_length"] = total_text_length / items_with_text
             self.metrics["total_text_chars"] = total_text_length
 
@@ -185,55 +300,47 @@ class MetricsAnalyzer:
                     self.metrics[f"{type_name}_count"] = len(lengths)
 
             if text_lengths:
-                text_lengths.sort()
-                self.metrics["min_text_length"] = text_lengths[0]
-                self.metrics["max_text_length"] = text_lengths[-1]
-                self.metrics["median_text_length"] = text_lengths[len(text_lengths) // 2]
-
-                p25_idx = len(text_lengths) // 4
-                p75_idx = (3 * len(text_lengths)) // 4
-                self.metrics["text_length_p25"] = text_lengths[p25_idx]
-                self.metrics["text_length_p75"] = text_lengths[p75_idx]
-
-    def _analyze_urls(self, items: list[JsonItem]) -> None:
+                self.metrics["min_text_length"] = min(text_lengths)
+                self.metrics["max_text_length"] = max(text_lengths)
+
+                if len(text_lengths) > 1:
+                    p25, p50, p75 = quantiles(text_lengths, n=4, method="inclusive")
+                else:
+                    p25 = p50 = p75 = text_lengths[0]
+                self.metrics["median_text_length"] = int(p50)
+                self.metrics["text_length_p25"] = int(p25)
+                self.metrics["text_length_p75"] = int(p75)
+
+    def _analyze_urls(self, columns: dict[str, Any]) -> None:
         """Analyze URL patterns across all items."""
         page_urls: set[str] = set()
         thread_urls: set[str] = set()
         all_urls: list[str] = []
-        domains: dict[str, int] = defaultdict(int)
-        url_patterns: dict[str, int] = defaultdict(int)
 
-        for item in items:
-            # track page urls (from pages/raw file)
-            if "url" in item and not ("thread_url" in item or "post_id" in item):
-                url = item["url"]
-                if isinstance(url, str):
-                    page_urls.add(url)
-                    all_urls.append(url)
+        for url, thread_url, is_post in zip(
+            columns["url"], columns["thread_url"], columns["is_post"]
+        ):
+            # track page urls (from pages/raw file); exact C-level type check
+            # since JSON-sourced strings are never str subclasses
+            if type(url) is str and not is_post:
+                page_urls.add(url)
+                all_urls.append(url)
 
             # track thread urls (from posts file)
-            if "thread_url" in item and isinstance(item["thread_url"], str):
-                thread_url = item["thread_url"]
+            if type(thread_url) is str:
                 thread_urls.add(thread_url)
                 all_urls.append(thread_url)
 
-            # analyze all url fields for patterns
-            for field in URL_FIELDS:
-                if field in item and isinstance(item[field], str):
-                    url = item[field]
-
-                    # extract domain and analyze patterns
-                    parsed = cast(ParseResult, urlparse(url))
-                    if parsed.netloc:
-                        domains[parsed.netloc] += 1
-
-                    # analyze url patterns
-                    if "/threads/" in url:
-                        url_patterns["thread_pattern_count"] += 1
-                    if "/post-" in url:
-                        url_patterns["post_redirect_count"] += 1
-                    if "/page-" in url or "page=" in url:
-                        url_patterns["pagination_count"] += 1
+        # tally domains and patterns over the flat url list; per-URL facts are
+        # memoized, so repeated thread_urls cost one cache hit each
+        facts = [_url_facts(url) for url in columns["field_urls"]]
+        domains = Counter(host for host, *_ in facts if host)
+        url_patterns = {
+            "thread_pattern_count": sum(has_thread for _, _, has_thread, _, _ in facts),
+            "post_redirect_count": sum(has_post for _, _, _, has_post, _ in facts),
+            "pagination_count": sum(has_page for _, _, _, _, has_page in facts),
+        }
+        url_patterns = {name: count for name, count in url_patterns.items() if count}
 
         self.metrics["unique_page_urls"] = len(page_urls)
         self.metrics["unique_thread_urls"] = len(thread_urls)
@@ -245,38 +352,34 @@ class MetricsAnalyzer:
 
             if domains:
                 self.metrics["unique_domains"] = len(domains)
-                top_domains = sorted(domains.items(), key=lambda x: x[1], reverse=True)[:3]
-                self.metrics["top_domains"] = {domain: count for domain, count in top_domains}
+                self.metrics["top_domains"] = dict(domains.most_common(3))
 
             if url_patterns:
-                self.metrics["url_patterns"] = dict(url_patterns)
+                self.metrics["url_patterns"] = url_patterns
 
-    def _analyze_identifiers(self, items: list[JsonItem]) -> None:
+    def _analyze_identifiers(self, columns: dict[str, Any]) -> None:
         """Analyze identifiers and check for duplicates."""
-        all_ids: list[str] = []
-        for item in items:
-            for field in ID_FIELDS:
-                if field in item:
-                    all_ids.append(str(item[field]))
-                    break
-
-        if all_ids:
-            unique_ids = set(all_ids)
-            self.metrics["items_with_ids"] = len(all_ids)
+        # stream ids through one set and a running count; duplicates fall out
+        # of the difference without materializing an intermediate list
+        unique_ids: set[str] = set()
+        total_ids = 0
+        for item_id in columns["id"]:
+            if item_id is not None:
+                unique_ids.add(item_id)
+                total_ids += 1
+
+        if total_ids:
+            duplicates = total_ids - len(unique_ids)
+            self.metrics["items_with_ids"] = total_ids
             self.metrics["unique_ids"] = len(unique_ids)
 
-            if len(all_ids) > len(unique_ids):
-                self.metrics["duplicate_items"] = len(all_ids) - len(unique_ids)
-                self.metrics["duplication_rate"] = (len(all_ids) - len(unique_ids)) / len(all_ids)
+            if duplicates > 0:
+                self.metrics["duplicate_items"] = duplicates
+                self.metrics["duplication_rate"] = duplicates / total_ids
 
-    def _analyze_authors(self, items: list[JsonItem]) -> None:
+    def _analyze_authors(self, columns: dict[str, Any]) -> None:
         """Analyze author/user information."""
-        authors: list[str] = []
-        for item in items:
-            for field in AUTHOR_FIELDS:
-                if field in item and item[field]:
-                    authors.append(str(item[field]))
-                    break
+        authors = [author for author in columns["author"] if author is not None]
 
         if authors:
             unique_authors = set(authors)
@@ -284,31 +387,21 @@ class MetricsAnalyzer:
             self.metrics["unique_authors"] = len(unique_authors)
             self.metrics["items_per_author"] = len(authors) / len(unique_authors)
 
-            author_counts: dict[str, int] = defaultdict(int)
-            for author in authors:
-                author_counts[author] += 1
-
-            counts = list(author_counts.values())
-            counts.sort(reverse=True)
-
-    def _analyze_threads(self, items: list[JsonItem]) -> None:
+    def _analyze_threads(self, columns: dict[str, Any]) -> None:
         """Analyze thread-related patterns (works for forums, reddit, etc)."""
         thread_ids: list[str] = []
 
-        for item in items:
+        for thread_url, url, fallback in zip(
+            columns["thread_url"], columns["url"], columns["thread_id_fallback"]
+        ):
             thread_id = None
 
-            if "thread_url" in item or "url" in item:
-                url = item.get("thread_url") or item.get("url", "")
-
-                for pattern in THREAD_ID_PATTERNS:
-                    match = re.search(pattern, url)
-                    if match:
-                        thread_id = match.group(1)
-                        break
+            ref = thread_url or url
+            if ref:
+                thread_id = _url_facts(ref)[1]
 
             if not thread_id:
-                thread_id = item.get("thread_id") or item.get("topic_id")
+                thread_id = fallback
 
             if thread_id:
                 thread_ids.append(str(thread_id))
@@ -322,34 +415,52 @@ class MetricsAnalyzer:
             self.metrics["total_thread_items"] = len(thread_ids)
 
             if thread_counts:
-                counts: list[int] = list(thread_counts.values())
-                counts.sort(reverse=True)
-
-                self.metrics["avg_items_per_thread"] = sum(counts) / len(counts)
+                self.metrics["avg_items_per_thread"] = sum(thread_counts.values()) / len(
+                    thread_counts
+                )
 
                 if self.metrics.get("total_items"):
                     self.metrics["thread_coverage_breadth"] = (
                         len(thread_counts) / self.metrics["total_items"]
                     )
 
-    def _analyze_temporal_data(self, items: list[JsonItem]) -> None:
+    def _analyze_temporal_data(self, columns: dict[str, Any]) -> None:
         """Analyze temporal patterns in the data."""
-        dates_found = 0
-        for item in items:
-            for field in DATE_FIELDS:
-                if field in item and item[field]:
-                    dates_found += 1
-                    break
+        dates_found = sum(columns["has_date"])
 
         if dates_found > 0:
             self.metrics["items_with_dates"] = dates_found
-            self.metrics["temporal_coverage"] = dates_found / len(items)
-
-    def _extract_text(self, item: JsonItem, field_names: list[str]) -> str:
-        """Extract text from item trying multiple field names."""
-        for field in field_names:
-            if field in item:
+            self.metrics["temporal_coverage"] = dates_found / columns["count"]
+
+    def _extract_text(self, item: JsonItem) -> str:
+        """Extract text from item trying the known text field names."""
+        hits = item.keys() & TEXT_FIELDS_SET
+        if not hits:
+            return ""
+        for field in TEXT_FIELDS:
+            if field in hits:
                 value = item[field]
-                if isinstance(value, str) and value.strip():
+                if type(value) is str and value.strip():
                     return value
         return ""
+
+    def _extract_id(self, item: JsonItem) -> str | None:
+        """Extract the highest-priority identifier field as a string."""
+        hits = item.keys() & ID_FIELDS_SET
+        if not hits:
+            return None
+        field = next(f for f in ID_FIELDS if f in hits)
+        return str(item[field])
+
+    def _extract_author(self, item: JsonItem) -> str | None:
+        """Extract the highest-priority non-empty author field as a string."""
+        hits = item.keys() & AUTHOR_FIELDS_SET
+        for field in AUTHOR_FIELDS:
+            if field in hits and item[field]:
+                return str(item[field])
+        return None
+
+    def _has_date(self, item: JsonItem) -> bool:
+        """Check whether the item carries any non-empty date field."""
+        hits = item.keys() & DATE_FIELDS_SET
+        return any(item[field] for field in hits)
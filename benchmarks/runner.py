@@ -1,18 +1,25 @@
 """Benchmark runner for scrapers with quality metrics."""
 
-import json
+import mmap
 import os
 import shutil
 import subprocess
 import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .enhanced_metrics import EnhancedMetricsAnalyzer
 from .metrics import MetricsCollector
 from .quality_metrics import MetricsAnalyzer
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+COLLECTORS_DIR = PROJECT_ROOT / "collectors"
+
 CACHE_DIR_DEFAULT = Path.home() / ".cache" / "tunai_scrapers"
 BENCHMARK_RESULTS_DIR_DEFAULT = CACHE_DIR_DEFAULT / "benchmarks" / "results"
 BENCHMARK_LOGS_DIR_DEFAULT = CACHE_DIR_DEFAULT / "benchmarks" / "logs"
@@ -29,12 +36,30 @@ RESOURCE_SAMPLE_INTERVAL_SECONDS = 0.5
 BYTES_PER_KB = 1024
 BYTES_PER_MB = BYTES_PER_KB * BYTES_PER_KB
 
-JSON_INDENT_SPACES = 2
-
 TIMESTAMP_FORMAT_FILE = "%Y%m%d_%H%M%S"
 TIMESTAMP_FORMAT_HUMAN = "%Y-%m-%d %H:%M:%S"
 
+# Static command-line fragments shared by every run of a collector; built
+# once at import so the per-run config methods only fill in the variable
+# limit and output paths
+REDDIT_STATIC_ARGS = ("--sub", "Tunisia", "--sort", "new")
+SITES_STATIC_ARGS = ("--start_urls", "https://www.pm.gov.tn", "--domains", "pm.gov.tn")
+YOUTUBE_STATIC_ARGS = ("--search", "darija tunisienne")
+FACEBOOK_STATIC_ARGS = ("--groups", "Texas A&M Free and For Sale")
+
 ERROR_LOG_TAIL_LINES = 30
+ERROR_LOG_TAIL_WINDOW_BYTES = 64 * 1024
+ERROR_LOG_TAIL_WINDOW_MAX_BYTES = 256 * 1024
+
+LINE_COUNT_CHUNK_BYTES = 1 << 20
+# Files at least this large go through the mmap counting path on Linux,
+# where MADV_SEQUENTIAL lets the kernel prefetch ahead of the scan
+LINE_COUNT_MMAP_MIN_BYTES = 4 << 20
+LINE_COUNT_CACHE_MAX_ENTRIES = 256
+
+# Cached line counts keyed by (path, mtime_ns, size) so the same output file
+# is not re-scanned between item counting and data-file printing
+_line_count_cache: dict[tuple[str, int, int], int] = {}
 
 
 class BenchmarkRunner:
@@ -105,29 +130,55 @@ class BenchmarkRunner:
 
         return result
 
+    def run_all(
+        self,
+        collector_names: list[str],
+        limit: int,
+        delete_data: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """Run benchmarks for several collectors concurrently.
+
+        The runs are fully independent and mostly blocked on collector
+        network I/O, so fanning them across a process pool overlaps them.
+
+        Args:
+            collector_names: Names of the collectors to benchmark.
+            limit: Limit parameter passed to every collector.
+            delete_data: Whether to delete collected data after each benchmark.
+
+        Returns:
+            Mapping of collector name to its benchmark result dictionary.
+        """
+        results: dict[str, dict[str, Any]] = {}
+        max_workers = min(len(collector_names), os.cpu_count() or 1)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.run_benchmark, name, limit, delete_data): name
+                for name in collector_names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    print(f"\n[ERROR] Benchmark for '{name}' raised: {exc}")
+                    results[name] = {"success": False, "error": str(exc)}
+
+        return results
+
     def _get_collector_config(
         self, collector_name: str, limit: int, run_data_dir: Path
     ) -> dict[str, Any]:
         """Get configuration for a specific collector."""
-        project_root = Path(__file__).parent.parent
-        collectors_dir = project_root / "collectors"
-
-        if collector_name == "reddit":
-            return self._config_reddit(limit, run_data_dir, collectors_dir)
-        elif collector_name == "sites":
-            return self._config_sites(limit, run_data_dir, collectors_dir)
-        elif collector_name == "tunisia_sat":
-            return self._config_tunisia_sat(limit, run_data_dir, collectors_dir)
-        elif collector_name == "derja_ninja":
-            return self._config_derja_ninja(limit, run_data_dir, collectors_dir)
-        elif collector_name == "youtube":
-            return self._config_youtube(limit, run_data_dir, collectors_dir)
-        elif collector_name == "facebook":
-            return self._config_facebook(limit, run_data_dir, collectors_dir)
-        elif collector_name.startswith("scrapy_"):
+        if collector_name.startswith("scrapy_"):
             return self._config_scrapy(collector_name, limit, run_data_dir)
-        else:
-            raise ValueError(f"Unknown collector '{collector_name}'")
+
+        try:
+            config_method = self._COLLECTOR_CONFIGS[collector_name]
+        except KeyError:
+            raise ValueError(f"Unknown collector '{collector_name}'") from None
+        return config_method(self, limit, run_data_dir, COLLECTORS_DIR)
 
     def _config_reddit(
         self, limit: int, run_data_dir: Path, collectors_dir: Path
@@ -140,12 +191,9 @@ class BenchmarkRunner:
             "command": [
                 sys.executable,
                 str(collectors_dir / "collect_reddit.py"),
-                "--sub",
-                "Tunisia",
+                *REDDIT_STATIC_ARGS,
                 "--limit",
                 str(limit),
-                "--sort",
-                "new",
                 "--out_posts",
                 str(out_posts),
                 "--out_comments",
@@ -162,10 +210,7 @@ class BenchmarkRunner:
             "command": [
                 sys.executable,
                 str(collectors_dir / "collect_sites.py"),
-                "--start_urls",
-                "https://www.pm.gov.tn",
-                "--domains",
-                "pm.gov.tn",
+                *SITES_STATIC_ARGS,
                 "--max_pages",
                 str(limit),
                 "--out",
@@ -234,8 +279,7 @@ class BenchmarkRunner:
                 "run",
                 "python",
                 str(collectors_dir / "collect_youtube.py"),
-                "--search",
-                "darija tunisienne",
+                *YOUTUBE_STATIC_ARGS,
                 "--pages",
                 str(limit),
                 "--out",
@@ -258,8 +302,7 @@ class BenchmarkRunner:
             "command": [
                 sys.executable,
                 str(collectors_dir / "collect_facebook.py"),
-                "--groups",
-                "Texas A&M Free and For Sale",
+                *FACEBOOK_STATIC_ARGS,
                 "--per_group_limit",
                 str(limit),
                 "--out",
@@ -340,6 +383,17 @@ class BenchmarkRunner:
 
         return {"command": cmd, "output_files": output_files}
 
+    # Dispatch table for _get_collector_config, built once at class creation;
+    # scrapy_* names are handled by prefix before the lookup
+    _COLLECTOR_CONFIGS = {
+        "reddit": _config_reddit,
+        "sites": _config_sites,
+        "tunisia_sat": _config_tunisia_sat,
+        "derja_ninja": _config_derja_ninja,
+        "youtube": _config_youtube,
+        "facebook": _config_facebook,
+    }
+
     def _execute_benchmark(
         self,
         command: list[str],
@@ -358,7 +412,9 @@ class BenchmarkRunner:
 
         exit_code = self._run_process(command, log_file, metrics, timeout_seconds)
 
-        items_count = sum(self._count_items_in_jsonl(f) for f in output_files if f.exists())
+        # One scandir pass per output directory instead of a stat() per path
+        file_stats = self._stat_output_files(output_files)
+        items_count = sum(self._count_items_in_jsonl(f) for f in output_files if f in file_stats)
         success = exit_code == 0
 
         result = metrics.stop(items_count, success)
@@ -366,7 +422,7 @@ class BenchmarkRunner:
 
         if success:
             result_dict = self._add_quality_metrics(
-                result_dict, output_files, result.total_runtime_seconds
+                result_dict, output_files, result.total_runtime_seconds, file_stats
             )
             self._print_success_summary(result, result_dict)
         else:
@@ -376,7 +432,7 @@ class BenchmarkRunner:
 
         print(f"[RESULTS] {self.results_dir / f'{collector_name}_{timestamp}.json'}")
         print(f"[LOG] {log_file}")
-        self._print_data_files(output_files)
+        self._print_data_files(output_files, file_stats)
 
         return result_dict
 
@@ -388,48 +444,54 @@ class BenchmarkRunner:
         timeout_seconds: int,
     ) -> int:
         """Run the collector process with monitoring."""
-        with open(log_file, "w", encoding="utf-8") as log:
-            process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, text=True)
+        # The child inherits the raw fd, so Python-side buffering on this
+        # handle cannot batch the child's writes; open in binary to make it
+        # explicit that only the descriptor is used. Write batching belongs
+        # to the child (Python children line-buffer stdout when piped to a
+        # file, and Scrapy logs through a buffered stream already).
+        with open(log_file, "wb") as log:
+            process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
             metrics.attach_to_process(process.pid)
 
-            start_time = time.time()
-            while True:
-                exit_code = process.poll()
-                if exit_code is not None:
-                    return exit_code
-
-                if time.time() - start_time > timeout_seconds:
-                    process.kill()
-                    process.wait()
-                    return -1
-
-                metrics.sample()
-                time.sleep(RESOURCE_SAMPLE_INTERVAL_SECONDS)
+            # Resource sampling happens on the MetricsCollector's background
+            # thread, so exit detection can block in waitpid instead of
+            # waking up every sample interval to poll
+            try:
+                return process.wait(timeout=timeout_seconds)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                return -1
 
     def _add_quality_metrics(
         self,
         result_dict: dict[str, Any],
         output_files: list[Path],
         runtime_seconds: float,
+        file_stats: dict[Path, os.stat_result] | None = None,
     ) -> dict[str, Any]:
         """Add quality metrics to results."""
+        if file_stats is None:
+            file_stats = self._stat_output_files(output_files)
         analyzer = MetricsAnalyzer(output_files)
         quality_metrics = analyzer.calculate_all_metrics()
         result_dict.update(quality_metrics)
 
-        # Add enhanced metrics for duplication analysis
+        # Add enhanced metrics for duplication analysis, reusing the parses
+        # the quality analyzer just cached instead of re-reading the files
         if output_files:
             try:
                 enhanced = EnhancedMetricsAnalyzer()
                 items = []
                 for file_path in output_files:
-                    if file_path.suffix == ".jsonl" and "posts" in file_path.name:
-                        with open(file_path) as f:
-                            for line in f:
-                                try:
-                                    items.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    continue
+                    if file_path.suffix != ".jsonl" or "posts" not in file_path.name:
+                        continue
+                    # Skip missing or empty files via the prebuilt stat index
+                    # instead of reopening each one
+                    stat = file_stats.get(file_path)
+                    if stat is None or stat.st_size == 0:
+                        continue
+                    items.extend(analyzer.load_jsonl(file_path))
 
                 if items:
                     result_dict["enhanced_metrics"] = enhanced.calculate_all_metrics(items)
@@ -514,22 +576,90 @@ class BenchmarkRunner:
     ) -> None:
         """Save benchmark results to JSON file."""
         result_file = self.results_dir / f"{collector_name}_{timestamp}.json"
-        with open(result_file, "w", encoding="utf-8") as file:
-            json.dump(result_dict, file, indent=JSON_INDENT_SPACES, default=str)
+        with open(result_file, "wb") as file:
+            file.write(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2, default=str))
 
     @staticmethod
     def _count_items_in_jsonl(filepath: Path) -> int:
-        """Count items in a JSONL file."""
+        """Count items in a JSONL file by counting newline bytes."""
         try:
-            with open(filepath, encoding="utf-8") as file:
-                return sum(1 for _ in file)
+            stat = filepath.stat()
+        except OSError:
+            return 0
+
+        cache_key = (str(filepath), stat.st_mtime_ns, stat.st_size)
+        cached = _line_count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Count raw b'\n' bytes; no UTF-8 decode and no per-line str
+        # allocation just to discard it. Large files on Linux are scanned
+        # through mmap with a sequential-access hint so the kernel prefetches
+        # ahead of the count; elsewhere, and for small files, chunked reads
+        # avoid the mapping overhead.
+        total = 0
+        last_byte = b"\n"
+        try:
+            with open(filepath, "rb", buffering=0) as file:
+                if sys.platform.startswith("linux") and stat.st_size >= LINE_COUNT_MMAP_MIN_BYTES:
+                    with mmap.mmap(file.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                        for start in range(0, stat.st_size, LINE_COUNT_CHUNK_BYTES):
+                            chunk = mm[start : start + LINE_COUNT_CHUNK_BYTES]
+                            total += chunk.count(b"\n")
+                        last_byte = mm[-1:]
+                else:
+                    while chunk := file.read(LINE_COUNT_CHUNK_BYTES):
+                        total += chunk.count(b"\n")
+                        last_byte = chunk[-1:]
         except Exception:
             return 0
 
+        # A final line without a trailing newline is still an item
+        if last_byte != b"\n":
+            total += 1
+
+        if len(_line_count_cache) >= LINE_COUNT_CACHE_MAX_ENTRIES:
+            _line_count_cache.pop(next(iter(_line_count_cache)))
+        _line_count_cache[cache_key] = total
+        return total
+
+    @staticmethod
+    def _stat_output_files(output_files: list[Path]) -> dict[Path, os.stat_result]:
+        """Stat output files with one scandir pass per parent directory.
+
+        Returns a mapping of existing paths to their stat results; missing
+        files are simply absent, so `path in index` replaces exists().
+        """
+        wanted: defaultdict[Path, dict[str, Path]] = defaultdict(dict)
+        for path in output_files:
+            wanted[path.parent][path.name] = path
+
+        stats: dict[Path, os.stat_result] = {}
+        for parent, names in wanted.items():
+            try:
+                entries = os.scandir(parent)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    target = names.get(entry.name)
+                    if target is None:
+                        continue
+                    try:
+                        stats[target] = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        pass
+        return stats
+
     @staticmethod
-    def _print_data_files(output_files: list[Path]) -> None:
+    def _print_data_files(
+        output_files: list[Path], file_stats: dict[Path, os.stat_result] | None = None
+    ) -> None:
         """Print information about output data files."""
-        existing_files = [f for f in output_files if f.exists()]
+        if file_stats is None:
+            file_stats = BenchmarkRunner._stat_output_files(output_files)
+        existing_files = [f for f in output_files if f in file_stats]
         if not existing_files:
             return
 
@@ -540,18 +670,45 @@ class BenchmarkRunner:
 
     @staticmethod
     def _print_error_log_tail(log_file: Path) -> None:
-        """Print the last few lines of error log."""
+        """Print the last few lines of error log.
+
+        Reads a fixed-size window from the end of the file instead of the
+        whole log; failed Scrapy runs at LOG_LEVEL=INFO can leave logs many
+        megabytes long and only the tail is ever shown.
+        """
         try:
-            with open(log_file, encoding="utf-8") as file:
-                lines = file.readlines()
+            size = log_file.stat().st_size
+            with open(log_file, "rb") as file:
+                window = ERROR_LOG_TAIL_WINDOW_BYTES
+                while True:
+                    read = min(size, window)
+                    file.seek(size - read)
+                    tail = file.read(read)
+                    enough = tail.count(b"\n") >= ERROR_LOG_TAIL_LINES
+                    if enough or read >= size or window >= ERROR_LOG_TAIL_WINDOW_MAX_BYTES:
+                        break
+                    window = ERROR_LOG_TAIL_WINDOW_MAX_BYTES
         except Exception:
             return
 
+        lines = tail.splitlines()[-ERROR_LOG_TAIL_LINES:]
         if not lines:
             return
 
         print("[ERROR] Log tail:")
-        print("".join(lines[-ERROR_LOG_TAIL_LINES:]))
+        print(b"\n".join(lines).decode("utf-8", "replace"))
+
+
+def _describe_item_type(collector_name: str) -> str:
+    """Describe what the limit counts for a collector, for log messages."""
+    if "reddit" in collector_name:
+        return "posts"
+    elif "youtube" in collector_name:
+        return "pages (videos)"
+    elif "facebook" in collector_name:
+        return "posts per group"
+    else:
+        return "pages"
 
 
 def main() -> None:
@@ -562,6 +719,7 @@ def main() -> None:
     parser.add_argument(
         "--collector",
         required=True,
+        nargs="+",
         choices=[
             "reddit",
             "sites",
@@ -576,7 +734,7 @@ def main() -> None:
             "scrapy_youtube",
             "scrapy_facebook_groups",
         ],
-        help="Collector to benchmark",
+        help="Collector(s) to benchmark; multiple names run concurrently",
     )
     parser.add_argument(
         "--limit",
@@ -599,22 +757,23 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if "reddit" in args.collector:
-        item_type = "posts"
-    elif "youtube" in args.collector:
-        item_type = "pages (videos)"
-    elif "facebook" in args.collector:
-        item_type = "posts per group"
-    else:
-        item_type = "pages"
-    print(f"\n[BENCHMARK] Starting {args.collector} with {args.limit} {item_type}")
+    for collector_name in args.collector:
+        item_type = _describe_item_type(collector_name)
+        print(f"\n[BENCHMARK] Starting {collector_name} with {args.limit} {item_type}")
 
     runner = BenchmarkRunner(local=args.local)
-    runner.run_benchmark(
-        collector_name=args.collector,
-        limit=args.limit,
-        delete_data=args.delete_data,
-    )
+    if len(args.collector) > 1:
+        runner.run_all(
+            collector_names=args.collector,
+            limit=args.limit,
+            delete_data=args.delete_data,
+        )
+    else:
+        runner.run_benchmark(
+            collector_name=args.collector[0],
+            limit=args.limit,
+            delete_data=args.delete_data,
+        )
 
 
 if __name__ == "__main__":
@@ -38,60 +38,69 @@ class Config:
         if env_file := os.getenv("TUNAI_PARSER_ENV_FILE"):
             locations.insert(0, Path(env_file))
 
-        # Load from first .env file found
-        for location in locations:
-            if location.exists():
-                load_dotenv(location)
-                self.env_file = location
-                break
-        else:
-            # No .env file found, will use system environment variables only
-            self.env_file = None
+        # Load from first .env file found; None means system environment only
+        self.env_file = next((loc for loc in locations if loc.exists()), None)
+        if self.env_file is not None:
+            load_dotenv(self.env_file)
+
+        # Values never change after the dotenv load, so read them once here;
+        # the properties below are thin readers of these cached attributes
+        self._reddit_client_id = os.getenv("REDDIT_CLIENT_ID")
+        self._reddit_client_secret = os.getenv("REDDIT_CLIENT_SECRET")
+        self._youtube_api_key = os.getenv("YOUTUBE_API_KEY")
+        self._facebook_access_token = os.getenv("FACEBOOK_ACCESS_TOKEN")
+        self._google_cse_id = os.getenv("GOOGLE_CSE_ID")
+        self._google_api_key = os.getenv("GOOGLE_API_KEY")
+        self._twitter_bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
+        self._output_dir = Path(os.getenv("TUNAI_PARSER_OUTPUT_DIR", "data/raw"))
+        self._cache_dir = Path(
+            os.getenv("TUNAI_PARSER_CACHE_DIR", Path.home() / ".cache" / "tunai_scrapers")
+        )
 
     @property
     def reddit_client_id(self) -> str | None:
         """Reddit API client ID."""
-        return os.getenv("REDDIT_CLIENT_ID")
+        return self._reddit_client_id
 
     @property
     def reddit_client_secret(self) -> str | None:
         """Reddit API client secret."""
-        return os.getenv("REDDIT_CLIENT_SECRET")
+        return self._reddit_client_secret
 
     @property
     def youtube_api_key(self) -> str | None:
         """YouTube API key."""
-        return os.getenv("YOUTUBE_API_KEY")
+        return self._youtube_api_key
 
     @property
     def facebook_access_token(self) -> str | None:
         """Facebook access token."""
-        return os.getenv("FACEBOOK_ACCESS_TOKEN")
+        return self._facebook_access_token
 
     @property
     def google_cse_id(self) -> str | None:
         """Google Custom Search Engine ID."""
-        return os.getenv("GOOGLE_CSE_ID")
+        return self._google_cse_id
 
     @property
     def google_api_key(self) -> str | None:
         """Google API key."""
-        return os.getenv("GOOGLE_API_KEY")
+        return self._google_api_key
 
     @property
     def twitter_bearer_token(self) -> str | None:
         """Twitter/X API bearer token."""
-        return os.getenv("TWITTER_BEARER_TOKEN")
+        return self._twitter_bearer_token
 
     @property
     def output_dir(self) -> Path:
         """Default output directory for scraped data."""
-        return Path(os.getenv("TUNAI_PARSER_OUTPUT_DIR", "data/raw"))
+        return self._output_dir
 
     @property
     def cache_dir(self) -> Path:
         """Cache directory for temporary data."""
-        return Path(os.getenv("TUNAI_PARSER_CACHE_DIR", Path.home() / ".cache" / "tunai_scrapers"))
+        return self._cache_dir
 
     def get(self, key: str, default: str | None = None) -> str | None:
         """
@@ -1,98 +1,117 @@
-"""Data items matching exact output format of original collectors."""
-
-import scrapy
-
-
-class RedditPost(scrapy.Item):
-    source = scrapy.Field()
-    id = scrapy.Field()
-    title = scrapy.Field()
-    selftext = scrapy.Field()
-    created_utc = scrapy.Field()
-    url = scrapy.Field()
-    score = scrapy.Field()
-    subreddit = scrapy.Field()
-    permalink = scrapy.Field()
-
-
-class RedditComment(scrapy.Item):
-    source = scrapy.Field()
-    id = scrapy.Field()
-    link_id = scrapy.Field()
-    parent_id = scrapy.Field()
-    body = scrapy.Field()
-    created_utc = scrapy.Field()
-    score = scrapy.Field()
-    permalink = scrapy.Field()
-    subreddit = scrapy.Field()
-
-
-class SiteItem(scrapy.Item):
-    source = scrapy.Field()
-    domain = scrapy.Field()
-    url = scrapy.Field()
-    title = scrapy.Field()
-    text = scrapy.Field()
-
-
-class TunisiaSatPost(scrapy.Item):
-    source = scrapy.Field()
-    thread_url = scrapy.Field()
-    post_id = scrapy.Field()
-    author = scrapy.Field()
-    datetime = scrapy.Field()
-    text = scrapy.Field()
-
-
-class TunisiaSatPage(scrapy.Item):
-    url = scrapy.Field()
-    text = scrapy.Field()
-
-
-class DerjaNinjaPage(scrapy.Item):
-    url = scrapy.Field()
-    text = scrapy.Field()
-
-
-class DerjaNinjaCard(scrapy.Item):
-    source = scrapy.Field()
-    url = scrapy.Field()
-    english = scrapy.Field()
-    arabic = scrapy.Field()
-    roman = scrapy.Field()
-
-
-class BettounsiPage(scrapy.Item):
-    url = scrapy.Field()
-    text = scrapy.Field()
-
-
-class YouTubeItem(scrapy.Item):
-    source = scrapy.Field()
-    video_id = scrapy.Field()
-    transcript = scrapy.Field()
-    comments = scrapy.Field()
-
-
-class XItem(scrapy.Item):
-    source = scrapy.Field()
-    id = scrapy.Field()
-    text = scrapy.Field()
-    lang = scrapy.Field()
-    created_at = scrapy.Field()
-    metrics = scrapy.Field()
-
-
-class FacebookPost(scrapy.Item):
-    source = scrapy.Field()
-    group_id = scrapy.Field()
-    post = scrapy.Field()
-
-
-class GoogleCSEItem(scrapy.Item):
-    source = scrapy.Field()
-    title = scrapy.Field()
-    link = scrapy.Field()
-    snippet = scrapy.Field()
-    query = scrapy.Field()
-    text = scrapy.Field()
+"""Data items matching exact output format of original collectors.
+
+Items are slotted dataclasses rather than scrapy.Item subclasses: Scrapy's
+ItemAdapter handles them natively, attribute access skips the dict-backed
+Field machinery, and __slots__ keeps per-item memory flat when a crawl
+yields hundreds of thousands of items.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class RedditPost:
+    source: str
+    id: str
+    title: str
+    selftext: str
+    created_utc: float
+    url: str
+    score: int
+    subreddit: str
+    permalink: str
+
+
+@dataclass(slots=True)
+class RedditComment:
+    source: str
+    id: str
+    link_id: str
+    parent_id: str
+    body: str
+    created_utc: float
+    score: int
+    permalink: str
+    subreddit: str
+
+
+@dataclass(slots=True)
+class SiteItem:
+    source: str
+    domain: str
+    url: str
+    title: str
+    text: str
+
+
+@dataclass(slots=True)
+class TunisiaSatPost:
+    source: str
+    thread_url: str
+    post_id: str
+    author: str | None
+    datetime: str | None
+    text: str
+
+
+@dataclass(slots=True)
+class TunisiaSatPage:
+    url: str
+    text: str
+
+
+@dataclass(slots=True)
+class DerjaNinjaPage:
+    url: str
+    text: str
+
+
+@dataclass(slots=True)
+class DerjaNinjaCard:
+    source: str
+    url: str
+    english: str
+    arabic: str
+    roman: str
+
+
+@dataclass(slots=True)
+class BettounsiPage:
+    url: str
+    text: str
+
+
+@dataclass(slots=True)
+class YouTubeItem:
+    source: str
+    video_id: str
+    transcript: list[dict[str, Any]] | None
+    comments: list[Any]
+
+
+@dataclass(slots=True)
+class XItem:
+    source: str
+    id: str
+    text: str
+    lang: str | None
+    created_at: str | None
+    metrics: dict[str, Any] | None
+
+
+@dataclass(slots=True)
+class FacebookPost:
+    source: str
+    group_id: str
+    post: dict[str, Any]
+
+
+@dataclass(slots=True)
+class GoogleCSEItem:
+    source: str
+    title: str
+    link: str
+    snippet: str | None
+    query: str
+    text: str
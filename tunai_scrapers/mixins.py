@@ -1,9 +1,15 @@
 """Reusable mixins for spider functionality."""
 
+from collections import Counter
+from operator import itemgetter
 from typing import Any
 from urllib.parse import urlparse
 
-from tunai_scrapers.utils.text import extract_text, extract_tokens, split_sentences
+from parsel.csstranslator import HTMLTranslator
+
+from tunai_scrapers.utils.text import Sample, extract_text, extract_tokens, split_sentences
+
+_css_to_xpath = HTMLTranslator().css_to_xpath
 
 
 class Priority:
@@ -29,77 +35,125 @@ class VocabularyMixin:
 
     MAX_VOCAB_EXAMPLES = 3
 
-    def __init__(self, *args: Any, **kwargs: Any):
-        """Initialize vocabulary tracking."""
+    def __init__(
+        self,
+        *args: Any,
+        vocab_enabled: bool | str = True,
+        vocab_top_k: int | str | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize vocabulary tracking.
+
+        The freq and samples containers are only allocated on the first
+        update, so runs that never record vocabulary pay nothing for it.
+
+        Args:
+            vocab_enabled: Set to false to skip vocabulary tracking entirely
+            vocab_top_k: Keep only the K most frequent tokens in the export
+        """
         super().__init__(*args, **kwargs)
-        self.freq: dict[str, int] = {}
-        self.samples: dict[str, dict[str, Any]] = {}
+        if isinstance(vocab_enabled, str):
+            vocab_enabled = vocab_enabled.lower() not in ("false", "0", "no")
+        self.vocab_enabled = vocab_enabled
+        self.vocab_top_k = int(vocab_top_k) if vocab_top_k is not None else None
+        self.freq: Counter[str] | None = None
+        self.samples: dict[str, Sample] | None = None
 
     def update_vocabulary(self, text: str) -> None:
         """Update vocabulary frequency and samples from text.
 
+        Iterates the sentences once and tokenizes each sentence directly,
+        so the sentence at hand is the example for its own tokens; this
+        replaces the per-token substring scan over all sentences, which was
+        quadratic in text length on long forum pages.
+
         Args:
             text: Text to extract tokens from
         """
-        if not text:
+        if not text or not self.vocab_enabled:
             return
 
-        arabic, romanized = extract_tokens(text)
-        sentences = split_sentences(text)
-
-        for token in arabic:
-            self._add_token_sample(token, "arabic", sentences)
+        self.update_vocabulary_from_sentences(split_sentences(text))
 
-        for token in romanized:
-            self._add_token_sample(token, "roman", sentences)
+    def update_vocabulary_from_sentences(self, sentences: list[str]) -> None:
+        """Update vocabulary from sentences that are already split.
 
-    def _add_token_sample(self, token: str, script: str, sentences: list[str]) -> None:
-        """Add a token to vocabulary with example sentences.
+        Callers that extract several texts from one page can split each
+        text once, pool the sentences and make a single call here instead
+        of paying the update machinery per text.
 
         Args:
-            token: The word/token to add
-            script: Either "arabic" or "roman"
-            sentences: List of sentences to search for examples
+            sentences: Pre-split sentences to tokenize
         """
-        self.freq[token] = self.freq.get(token, 0) + 1
+        if not sentences or not self.vocab_enabled:
+            return
 
-        if token not in self.samples:
-            examples = self._find_example_sentences(token, sentences)
-            self.samples[token] = {"script": script, "examples": examples}
+        if self.freq is None:
+            self.freq = Counter()
+            self.samples = {}
 
-    def _find_example_sentences(self, token: str, sentences: list[str]) -> list[str]:
-        """Find example sentences containing the token.
+        freq = self.freq
+        for sentence in sentences:
+            arabic, romanized = extract_tokens(sentence)
+            # Counter.update batches all increments for the sentence in C
+            if arabic:
+                freq.update(arabic)
+                self._record_examples(arabic, "arabic", sentence)
+            if romanized:
+                freq.update(romanized)
+                self._record_examples(romanized, "roman", sentence)
 
-        Args:
-            token: Token to search for
-            sentences: List of sentences to search
+    def _record_examples(self, tokens: list[str], script: str, sentence: str) -> None:
+        """Record a sentence as an example for the tokens it contains.
 
-        Returns:
-            Up to MAX_VOCAB_EXAMPLES sentences containing the token
+        Args:
+            tokens: Tokens extracted from the sentence
+            script: Either "arabic" or "roman"
+            sentence: The sentence the tokens came from
         """
-        examples = []
-        for sent in sentences:
-            if token in sent:
-                examples.append(sent)
-                if len(examples) >= self.MAX_VOCAB_EXAMPLES:
-                    break
-        return examples
-
-    def get_vocabulary_data(self) -> dict[str, Any]:
+        samples = self.samples
+
+        for token in tokens:
+            sample = samples.get(token)
+            if sample is None:
+                samples[token] = Sample(script, [sentence])
+                continue
+
+            examples = sample.examples
+            if len(examples) < self.MAX_VOCAB_EXAMPLES and sentence not in examples:
+                examples.append(sentence)
+
+    def get_vocabulary_data(self, top_k: int | None = None) -> dict[str, Any]:
         """Get vocabulary data for export.
 
+        Args:
+            top_k: If set, export only the K most frequent tokens; defaults
+                to the spider's vocab_top_k argument. Counter.most_common
+                keeps a K-sized heap instead of sorting every token.
+
         Returns:
             Dictionary with vocabulary statistics and samples
         """
+        if self.freq is None:
+            return {"total_words": 0, "vocab": []}
+
+        if top_k is None:
+            top_k = self.vocab_top_k
+
+        if top_k is not None:
+            items = self.freq.most_common(top_k)
+        else:
+            items = sorted(self.freq.items(), key=itemgetter(1), reverse=True)
+
         vocab = []
-        for word, count in sorted(self.freq.items(), key=lambda x: x[1], reverse=True):
-            sample = self.samples.get(word, {})
+        for word, count in items:
+            sample = self.samples.get(word)
             vocab.append(
                 {
                     "word": word,
                     "count": count,
-                    "script": sample.get("script"),
-                    "examples": sample.get("examples", []),
+                    "script": sample.script if sample else None,
+                    "examples": sample.examples if sample else [],
                 }
             )
 
@@ -120,6 +174,18 @@ class ContentExtractionMixin:
     TEXT_ELEMENT_SELECTORS = ["h1", "h2", "h3", "p", "li", "blockquote", "div.text"]
     SKIP_SELECTORS = ["script", "style", "nav", "footer", "noscript", "svg", "form", "iframe"]
 
+    # CSS selectors translated to XPath once at class creation so the
+    # per-response extraction calls skip the CSS-to-XPath translation
+    XPATH_TITLE = _css_to_xpath("title::text")
+    XPATH_META_AUTHOR = _css_to_xpath('meta[name="author"]::attr(content)')
+    XPATH_META_ARTICLE_AUTHOR = _css_to_xpath('meta[property="article:author"]::attr(content)')
+    XPATH_META_PUBLISHED_TIME = _css_to_xpath(
+        'meta[property="article:published_time"]::attr(content)'
+    )
+    XPATH_TIME_DATETIME = _css_to_xpath("time::attr(datetime)")
+    XPATH_META_DESCRIPTION = _css_to_xpath('meta[name="description"]::attr(content)')
+    XPATH_META_OG_DESCRIPTION = _css_to_xpath('meta[property="og:description"]::attr(content)')
+
     def extract_page_text(self, response) -> str:
         """Extract clean text from a response.
 
@@ -141,7 +207,7 @@ class ContentExtractionMixin:
         Returns:
             Page title or None
         """
-        return response.css("title::text").get()
+        return response.xpath(self.XPATH_TITLE).get()
 
     def extract_metadata(self, response) -> dict[str, str]:
         """Extract common metadata from page.
@@ -156,24 +222,24 @@ class ContentExtractionMixin:
 
         # Author
         author = (
-            response.css('meta[name="author"]::attr(content)').get()
-            or response.css('meta[property="article:author"]::attr(content)').get()
+            response.xpath(self.XPATH_META_AUTHOR).get()
+            or response.xpath(self.XPATH_META_ARTICLE_AUTHOR).get()
         )
         if author:
             metadata["author"] = author
 
         # Date
         date = (
-            response.css('meta[property="article:published_time"]::attr(content)').get()
-            or response.css("time::attr(datetime)").get()
+            response.xpath(self.XPATH_META_PUBLISHED_TIME).get()
+            or response.xpath(self.XPATH_TIME_DATETIME).get()
         )
         if date:
             metadata["date"] = date
 
         # Description
         description = (
-            response.css('meta[name="description"]::attr(content)').get()
-            or response.css('meta[property="og:description"]::attr(content)').get()
+            response.xpath(self.XPATH_META_DESCRIPTION).get()
+            or response.xpath(self.XPATH_META_OG_DESCRIPTION).get()
         )
         if description:
             metadata["description"] = description
@@ -234,6 +300,7 @@ class URLValidationMixin:
             if not skip_patterns:
                 return False
 
-            return any(path.startswith(pattern) for pattern in skip_patterns)
+            # Tuple-arg startswith runs the multi-prefix check in one C call
+            return path.startswith(skip_patterns)
         except Exception:
             return True
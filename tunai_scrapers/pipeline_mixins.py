@@ -1,11 +1,21 @@
 """Pipeline mixins for reducing code duplication."""
 
-import json
 from pathlib import Path
 from typing import Any
 
+import orjson
+from itemadapter import ItemAdapter
+
 from tunai_scrapers.utils.text import build_vocab
 
+# Large write buffer for JSONL output files; items are small, so the default
+# 8 KiB buffer flushes to the kernel every handful of items
+JSONL_WRITE_BUFFER_BYTES = 1 << 20
+
+# Serialized lines are batched and handed to the file in one writelines
+# call once this many are pending
+JSONL_PENDING_FLUSH_LINES = 64
+
 
 class VocabularyPipelineMixin:
     """Mixin for pipelines that need to save vocabulary data.
@@ -33,8 +43,8 @@ class VocabularyPipelineMixin:
         processed_dir = output_dir.parent / "processed"
         processed_dir.mkdir(parents=True, exist_ok=True)
 
-        # Build vocab data
-        vocab = build_vocab(spider.freq, spider.samples)
+        # Build vocab data, honoring the spider's top-K cap if one is set
+        vocab = build_vocab(spider.freq, spider.samples, top_k=getattr(spider, "vocab_top_k", None))
         vocab_data = {
             "site": site_name,
             "total_words": len(vocab),
@@ -46,8 +56,8 @@ class VocabularyPipelineMixin:
             vocab_filename = f"{spider.name}_words.json"
         vocab_file = processed_dir / vocab_filename
 
-        with open(vocab_file, "w", encoding="utf-8") as f:
-            json.dump(vocab_data, f, ensure_ascii=False, indent=2)
+        with open(vocab_file, "wb") as f:
+            f.write(orjson.dumps(vocab_data, option=orjson.OPT_INDENT_2))
 
 
 class MultiFilePipelineMixin:
@@ -70,17 +80,23 @@ class MultiFilePipelineMixin:
         files = {}
 
         for key, filename in file_specs.items():
-            files[key] = open(base_dir / filename, "w", encoding="utf-8")
+            files[key] = open(base_dir / filename, "wb", buffering=JSONL_WRITE_BUFFER_BYTES)
+
+        self._pending_lines: dict[Any, list[bytes]] = {}
 
         return files
 
     def close_multiple_files(self, files: dict[str, Any]) -> None:
-        """Close multiple file handles.
+        """Flush pending lines and close multiple file handles.
 
         Args:
             files: Dictionary of file handles to close
         """
+        pending_lines = getattr(self, "_pending_lines", {})
         for f in files.values():
+            pending = pending_lines.pop(f, None)
+            if pending:
+                f.writelines(pending)
             if hasattr(f, "close"):
                 f.close()
 
@@ -89,9 +105,16 @@ class MultiFilePipelineMixin:
 
         Args:
             file_handle: File handle to write to
-            item: Item to write as JSON (dict or Scrapy Item)
+            item: Item to write as JSON (dict or dataclass item)
         """
-        # Convert to dict if it's a Scrapy Item
-        item_dict = dict(item) if hasattr(item, "__getitem__") else item
-        line = json.dumps(item_dict, ensure_ascii=False) + "\n"
-        file_handle.write(line)
+        # orjson emits UTF-8 bytes directly, so the file stays in binary
+        # mode and Arabic text never takes an encode round-trip; plain dicts
+        # serialize in place without an adapter copy. Lines are batched so
+        # the file sees one writelines call per batch instead of a write
+        # per item.
+        item_dict = item if type(item) is dict else ItemAdapter(item).asdict()
+        pending = self._pending_lines.setdefault(file_handle, [])
+        pending.append(orjson.dumps(item_dict) + b"\n")
+        if len(pending) >= JSONL_PENDING_FLUSH_LINES:
+            file_handle.writelines(pending)
+            pending.clear()
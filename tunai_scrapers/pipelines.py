@@ -1,10 +1,16 @@
 """Pipelines for processing scraped items."""
 
-import json
 from pathlib import Path
 from typing import Any
 
-from tunai_scrapers.pipeline_mixins import MultiFilePipelineMixin, VocabularyPipelineMixin
+import orjson
+from itemadapter import ItemAdapter
+
+from tunai_scrapers.pipeline_mixins import (
+    JSONL_WRITE_BUFFER_BYTES,
+    MultiFilePipelineMixin,
+    VocabularyPipelineMixin,
+)
 
 
 class JsonLinesWriter:
@@ -22,7 +28,7 @@ class JsonLinesWriter:
     def open_spider(self, spider):
         self.output_dir.mkdir(parents=True, exist_ok=True)
         output_file = self.get_output_file(spider)
-        self.files[spider.name] = open(output_file, "w", encoding="utf-8")
+        self.files[spider.name] = open(output_file, "wb", buffering=JSONL_WRITE_BUFFER_BYTES)
 
     def close_spider(self, spider):
         if spider.name in self.files:
@@ -38,8 +44,13 @@ class JsonLinesWriter:
             return item
 
         if spider.name in self.files:
-            line = json.dumps(dict(transformed), ensure_ascii=False) + "\n"
-            self.files[spider.name].write(line)
+            # Plain dicts serialize in place; only item objects need the
+            # adapter copy
+            if type(transformed) is dict:
+                item_dict = transformed
+            else:
+                item_dict = ItemAdapter(transformed).asdict()
+            self.files[spider.name].write(orjson.dumps(item_dict) + b"\n")
         return transformed
 
     def get_output_file(self, spider) -> Path:
@@ -66,7 +77,7 @@ class RedditPipeline(MultiFilePipelineMixin, JsonLinesWriter):
         if transformed is None:
             return item
 
-        source = transformed.get("source", "")
+        source = ItemAdapter(transformed).get("source", "")
         if source == "reddit_comment" and "comments" in self.files:
             self.write_jsonl(self.files["comments"], transformed)
         else:
@@ -98,7 +109,7 @@ class TunisiaSatPipeline(VocabularyPipelineMixin, MultiFilePipelineMixin, JsonLi
         if transformed is None:
             return item
 
-        if transformed.get("source") == "tunisia-sat":
+        if ItemAdapter(transformed).get("source") == "tunisia-sat":
             self.write_jsonl(self.files["posts"], transformed)
         else:
             self.write_jsonl(self.files["pages"], transformed)
@@ -129,7 +140,7 @@ class DerjaNinjaPipeline(VocabularyPipelineMixin, MultiFilePipelineMixin, JsonLi
         if transformed is None:
             return item
 
-        if "english" in transformed:
+        if "english" in ItemAdapter(transformed):
             self.write_jsonl(self.files["cards"], transformed)
         else:
             self.write_jsonl(self.files["pages"], transformed)
@@ -143,7 +154,9 @@ class BettounsiPipeline(VocabularyPipelineMixin, JsonLinesWriter):
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir.parent / "processed").mkdir(parents=True, exist_ok=True)
 
-        self.files["pages"] = open(self.output_dir / "bettounsi_pages.jsonl", "w", encoding="utf-8")
+        self.files["pages"] = open(
+            self.output_dir / "bettounsi_pages.jsonl", "wb", buffering=JSONL_WRITE_BUFFER_BYTES
+        )
 
     def close_spider(self, spider):
         for f in self.files.values():
@@ -152,14 +165,14 @@ class BettounsiPipeline(VocabularyPipelineMixin, JsonLinesWriter):
         # For Bettounsi, spider already has vocab_data prepared
         if hasattr(spider, "vocab_data"):
             vocab_file = self.output_dir.parent / "processed" / "bettounsi_words.json"
-            with open(vocab_file, "w", encoding="utf-8") as f:
-                json.dump(spider.vocab_data, f, ensure_ascii=False, indent=2)
+            with open(vocab_file, "wb") as f:
+                f.write(orjson.dumps(spider.vocab_data, option=orjson.OPT_INDENT_2))
 
     def process_item(self, item, spider):
         transformed = self.transform_item(item, spider)
         if transformed is None:
             return item
 
-        line = json.dumps(dict(transformed), ensure_ascii=False) + "\n"
-        self.files["pages"].write(line)
+        item_dict = transformed if type(transformed) is dict else ItemAdapter(transformed).asdict()
+        self.files["pages"].write(orjson.dumps(item_dict) + b"\n")
         return transformed
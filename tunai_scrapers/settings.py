@@ -14,16 +14,26 @@ COOKIES_ENABLED = False
 
 LOG_LEVEL = "INFO"
 
+# Asyncio reactor dispatches many-socket crawls more cheaply than the
+# default SelectReactor
+TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
+
 CONCURRENT_REQUESTS = 16
 CONCURRENT_REQUESTS_PER_DOMAIN = 16
 DOWNLOAD_DELAY = 0
 
+# Explicit default so item-processing parallelism survives upstream changes
+CONCURRENT_ITEMS = 100
+
+# Target concurrency near the per-domain cap; the raised max delay lets
+# autothrottle back off further when a site slows down. Polite sites can
+# lower these per spider via custom_settings.
 AUTOTHROTTLE_ENABLED = True
 AUTOTHROTTLE_START_DELAY = 0.5
-AUTOTHROTTLE_MAX_DELAY = 2.0
-AUTOTHROTTLE_TARGET_CONCURRENCY = 6.0
+AUTOTHROTTLE_MAX_DELAY = 5.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 10.0
 
-REACTOR_THREADPOOL_MAXSIZE = 20
+REACTOR_THREADPOOL_MAXSIZE = 40
 
 RETRY_ENABLED = True
 RETRY_TIMES = 2
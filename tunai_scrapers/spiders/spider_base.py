@@ -41,8 +41,22 @@ class TunaiScrapersSpider(scrapy.Spider):
 
         self.pages_visited = 0
         self.visited_urls: set[str] = set()
+        self.scheduled_urls: set[str] = set()
         self.closing = False
 
+    def start_requests(self) -> Any:
+        """Yield start requests with their normalized URL attached.
+
+        Carrying the normalization in request meta means
+        should_process_page can read it back instead of re-parsing the URL
+        for every response.
+        """
+        for url in self.start_urls:
+            normalized = self.normalize_url(url, url) or url
+            yield scrapy.Request(
+                normalized, dont_filter=True, meta={"normalized_url": normalized}
+            )
+
     def should_process_page(self, response: Response) -> bool:
         """Check if we should process this page and update counters.
 
@@ -51,7 +65,12 @@ class TunaiScrapersSpider(scrapy.Spider):
         Args:
             response: The response object to check
         """
-        normalized = self.normalize_url(response.url, response.url)
+        # Requests yielded by our spiders carry the URL normalized at
+        # schedule time; only redirected or externally injected responses
+        # need the urljoin/urldefrag/urlparse pass here
+        normalized = response.meta.get("normalized_url")
+        if normalized is None or normalized != response.url:
+            normalized = self.normalize_url(response.url, response.url)
         if not normalized:
             return True
 
@@ -77,6 +96,26 @@ class TunaiScrapersSpider(scrapy.Spider):
 
         return True
 
+    def should_schedule_url(self, url: str) -> bool:
+        """Check whether a URL is worth turning into a Request, and claim it.
+
+        Scrapy's dupefilter would drop repeats eventually, but only after
+        paying for Request construction, fingerprinting and scheduling;
+        filtering against the spider's own visited and scheduled sets skips
+        that work entirely for links seen on many pages.
+
+        Args:
+            url: Normalized absolute URL about to be scheduled
+
+        Returns:
+            True if the URL is new; it is then recorded as scheduled
+        """
+        if url in self.visited_urls or url in self.scheduled_urls:
+            return False
+
+        self.scheduled_urls.add(url)
+        return True
+
     def should_schedule_more(self) -> bool:
         """Check if we should schedule more requests.
 
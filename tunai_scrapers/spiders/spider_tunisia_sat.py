@@ -1,19 +1,45 @@
 """Tunisia-sat spider."""
 
 from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urldefrag, urljoin, urlparse
 
 import scrapy
+from parsel.csstranslator import HTMLTranslator
 from scrapy.http import Response
 
 from tunai_scrapers.items import TunisiaSatPage, TunisiaSatPost
 from tunai_scrapers.mixins import Priority, VocabularyMixin
 from tunai_scrapers.spiders.spider_base import TunaiScrapersSpider
-from tunai_scrapers.utils.text import extract_text, extract_tokens, split_sentences
+from tunai_scrapers.utils.text import extract_text, split_sentences
 
 MIN_POST_TEXT_LENGTH = 20
 
+_css_to_xpath = HTMLTranslator().css_to_xpath
+
+
+@lru_cache(maxsize=4096)
+def _is_thread_url(url: str) -> bool:
+    """Check if URL is a thread page.
+
+    The same URL is checked in parse and again in _follow_links, and
+    thread pagination revisits near-identical URLs across many pages, so
+    the parse result is memoized. A module-level function rather than a
+    cached method: lru_cache on a method would also key on (and pin) the
+    spider instance.
+
+    Args:
+        url: Absolute URL to check
+
+    Returns:
+        True if the URL points at a forum thread
+    """
+    try:
+        return "/threads/" in urlparse(url).path
+    except ValueError:
+        return False
+
 
 class TunisiaSatSpider(VocabularyMixin, TunaiScrapersSpider):
     """Tunisia-sat forum crawler (Scrapy version of collect_tunisia_sat)."""
@@ -44,6 +70,21 @@ class TunisiaSatSpider(VocabularyMixin, TunaiScrapersSpider):
 
     DEFAULT_MAX_PAGES = 200
 
+    # CSS selectors translated to XPath once at class creation; these run for
+    # every post on every thread page, so skip the per-call translation
+    XPATH_MESSAGE_ARTICLE = _css_to_xpath("article.message")
+    XPATH_ATTR_DATA_CONTENT = _css_to_xpath("::attr(data-content)")
+    XPATH_ATTR_ID = _css_to_xpath("::attr(id)")
+    XPATH_BB_WRAPPER = _css_to_xpath("div.bbWrapper")
+    XPATH_TEXT = _css_to_xpath("::text")
+    XPATH_AUTHOR_NAME = _css_to_xpath(".message-name a::text")
+    XPATH_AUTHOR_LINK = _css_to_xpath("a.username::text")
+    XPATH_AUTHOR_CLASS = _css_to_xpath(".username::text")
+    XPATH_ATTR_DATA_AUTHOR = _css_to_xpath("::attr(data-author)")
+    XPATH_POST_DATETIME = _css_to_xpath("time::attr(datetime)")
+    XPATH_NEXT_PAGE = _css_to_xpath('a[rel="next"]::attr(href), .pageNav-page--next a::attr(href)')
+    XPATH_LINK_HREFS = _css_to_xpath("a::attr(href)")
+
     def __init__(self, max_pages: int | str = 200, *args: Any, **kwargs: Any) -> None:
         super().__init__(max_pages=max_pages, *args, **kwargs)
 
@@ -56,13 +97,22 @@ class TunisiaSatSpider(VocabularyMixin, TunaiScrapersSpider):
 
         url = response.url
 
-        if self._is_thread_url(url):
-            yield from self._parse_thread(response)
+        # Pool sentences from the posts and the page text so vocabulary is
+        # updated in one pass per page instead of once per post
+        sentences: list[str] = []
+
+        if _is_thread_url(url):
+            for post in self._parse_thread(response):
+                yield post
+                sentences.extend(split_sentences(post.text))
 
         text = extract_text(response.text)
         if text:
             yield TunisiaSatPage(url=url, text=text)
-            self.update_vocabulary(text)
+            sentences.extend(split_sentences(text))
+
+        if sentences:
+            self.update_vocabulary_from_sentences(sentences)
 
         if not self.should_schedule_more():
             return
@@ -71,22 +121,25 @@ class TunisiaSatSpider(VocabularyMixin, TunaiScrapersSpider):
 
     def _parse_thread(self, response: Response) -> Iterator[TunisiaSatPost]:
         """Extract posts from a thread page."""
-        for article in response.css("article.message"):
+        for article in response.xpath(self.XPATH_MESSAGE_ARTICLE):
             post = self._extract_post(article, response.url)
             if post:
                 yield post
-                self._update_post_vocabulary(post["text"])
 
     def _extract_post(self, article, thread_url: str) -> TunisiaSatPost | None:
         """Extract a single post from an article element."""
-        pid = article.css("::attr(data-content)").get() or article.css("::attr(id)").get() or ""
+        pid = (
+            article.xpath(self.XPATH_ATTR_DATA_CONTENT).get()
+            or article.xpath(self.XPATH_ATTR_ID).get()
+            or ""
+        )
 
         text = self._extract_post_text(article)
         if not text or len(text) <= MIN_POST_TEXT_LENGTH:
             return None
 
         author = self._extract_author(article)
-        datetime = article.css("time::attr(datetime)").get()
+        datetime = article.xpath(self.XPATH_POST_DATETIME).get()
 
         return TunisiaSatPost(
             source="tunisia-sat",
@@ -99,94 +152,95 @@ class TunisiaSatSpider(VocabularyMixin, TunaiScrapersSpider):
 
     def _extract_post_text(self, article) -> str:
         """Extract text from a post article."""
-        content_selector = article.css("div.bbWrapper")
+        content_selector = article.xpath(self.XPATH_BB_WRAPPER)
         if content_selector:
-            text = " ".join(content_selector.css("::text").getall()).strip()
+            text = " ".join(content_selector.xpath(self.XPATH_TEXT).getall()).strip()
         else:
-            text = " ".join(article.css("::text").getall()).strip()
+            text = " ".join(article.xpath(self.XPATH_TEXT).getall()).strip()
         return text
 
     def _extract_author(self, article) -> str | None:
         """Extract author from a post article."""
         # Try multiple selectors for better coverage
         author_el = (
-            article.css(".message-name a::text").get()
-            or article.css("a.username::text").get()
-            or article.css(".username::text").get()
-            or article.css("::attr(data-author)").get()  # Fallback to data-author attribute
+            article.xpath(self.XPATH_AUTHOR_NAME).get()
+            or article.xpath(self.XPATH_AUTHOR_LINK).get()
+            or article.xpath(self.XPATH_AUTHOR_CLASS).get()
+            or article.xpath(self.XPATH_ATTR_DATA_AUTHOR).get()  # Fallback to data-author attribute
         )
         return author_el.strip() if author_el else None
 
-    def _update_post_vocabulary(self, text: str) -> None:
-        """Update vocabulary from post text."""
-        sentences = split_sentences(text)
-        if not sentences:
-            return
-
-        arabic, roman = extract_tokens(text)
-        for token in arabic:
-            self._add_token_sample(token, "arabic", sentences)
-        for token in roman:
-            self._add_token_sample(token, "roman", sentences)
-
     def _follow_links(self, response: Response) -> Iterator[scrapy.Request]:
         """Follow links with appropriate priorities."""
+        # Enough URLs are already claimed to reach max_pages (visited URLs
+        # stay in the scheduled set, so its size bounds total visits);
+        # extracting and scheduling more would only pollute the queue with
+        # requests that get discarded at shutdown
+        if len(self.scheduled_urls) >= self.max_pages:
+            return
+
         url = response.url
 
         # Handle thread pagination first
-        if self._is_thread_url(url):
-            next_page = response.css(
-                'a[rel="next"]::attr(href), .pageNav-page--next a::attr(href)'
-            ).get()
+        if _is_thread_url(url):
+            next_page = response.xpath(self.XPATH_NEXT_PAGE).get()
             if next_page:
                 next_url = self.normalize_url(url, next_page, self.allowed_domains)
-                if next_url:
+                if next_url and self.should_schedule_url(next_url):
                     yield scrapy.Request(
-                        next_url, callback=self.parse, priority=Priority.PAGINATION
+                        next_url,
+                        callback=self.parse,
+                        priority=Priority.PAGINATION,
+                        meta={"normalized_url": next_url},
                     )
 
-        # Categorize and follow other links
-        links = self._categorize_links(response)
-
-        for next_url in links["threads"]:
-            yield scrapy.Request(next_url, callback=self.parse, priority=Priority.THREAD)
-
-        for next_url in links["posts"]:
-            yield scrapy.Request(next_url, callback=self.parse, priority=Priority.POST)
+        # Follow remaining links in a single pass, deciding the priority
+        # inline instead of bucketing URLs into per-category lists and
+        # iterating each bucket again
+        base_url = url
+        allowed_domains = self.allowed_domains
+        skip_prefixes = self.SKIP_PATH_PREFIXES
+        seen_hrefs: set[str] = set()
+
+        for href in response.xpath(self.XPATH_LINK_HREFS).getall():
+            # Forum nav repeats the same href many times per page
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
 
-        for next_url in links["other"]:
-            yield scrapy.Request(next_url, callback=self.parse, priority=Priority.NORMAL)
+            if not href or href.startswith(("javascript:", "mailto:", "#")):
+                continue
 
-    def _categorize_links(self, response: Response) -> dict[str, list[str]]:
-        """Categorize links by type for prioritization."""
-        links = {"threads": [], "posts": [], "other": []}
+            try:
+                next_url, _ = urldefrag(urljoin(base_url, href))
+                parsed = urlparse(next_url)
+            except Exception:
+                continue
 
-        for href in response.css("a::attr(href)").getall():
-            next_url = self.normalize_url(response.url, href, self.allowed_domains)
-            if not next_url:
+            if parsed.scheme not in ("http", "https"):
+                continue
+            if allowed_domains and parsed.netloc not in allowed_domains:
                 continue
 
-            # Skip unwanted paths
-            parsed = urlparse(next_url)
-            if any(parsed.path.startswith(sp) for sp in self.SKIP_PATH_PREFIXES):
+            # Tuple-arg startswith is one C call instead of an any() loop
+            path = parsed.path
+            if path.startswith(skip_prefixes):
                 continue
 
-            # Categorize by link type
-            if self._is_thread_url(next_url):
-                links["threads"].append(next_url)
+            if "/threads/" in path:
+                priority = Priority.THREAD
             elif "/post-" in next_url:
-                links["posts"].append(next_url)
+                priority = Priority.POST
             else:
-                links["other"].append(next_url)
-
-        return links
-
-    def _is_thread_url(self, url: str) -> bool:
-        """Check if URL is a thread page."""
-        try:
-            return "/threads/" in urlparse(url).path
-        except Exception:
-            return False
+                priority = Priority.NORMAL
+
+            if self.should_schedule_url(next_url):
+                yield scrapy.Request(
+                    next_url,
+                    callback=self.parse,
+                    priority=priority,
+                    meta={"normalized_url": next_url},
+                )
 
     def closed(self, reason: str) -> None:
         """Store vocabulary data for pipeline to save."""
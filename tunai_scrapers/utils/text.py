@@ -1,23 +1,40 @@
 """Text extraction and processing utilities."""
 
+import heapq
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from re import Pattern
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+# Tags whose content never contributes readable text
+STRIP_TAGS = ("script", "style", "nav", "footer", "noscript", "svg", "form", "iframe")
+
+# Elements that carry the readable content of a page
+TEXT_TAGS = ("h1", "h2", "h3", "p", "li", "blockquote")
 
 # Precompiled regex patterns for better performance
 ARABIC_PATTERN: Pattern = re.compile(r"[\u0600-\u06FF]{2,}")
 ROMAN_TOKEN_PATTERN: Pattern = re.compile(r"[A-Za-z0-9]{3,}")
+# Both token kinds in one pattern so extract_tokens scans the text once
+TOKEN_PATTERN: Pattern = re.compile(r"([\u0600-\u06FF]{2,})|([A-Za-z0-9]{3,})")
 TUNISIAN_DIGIT_PATTERN: Pattern = re.compile(r"[2395678]")
 SENTENCE_SPLIT_PATTERN: Pattern = re.compile(r"(?<=[.!؟?؛])\s+")
-WHITESPACE_PATTERN: Pattern = re.compile(r"\s+")
 FLASHCARD_PATTERN: Pattern = re.compile(
     r"Word of the day:\s*(.*?)\s+([\u0600-\u06FF].*?)\s+([A-Za-z0-9 '\-]+)"
 )
+ROMAN_LINE_PATTERN: Pattern = re.compile(r"[A-Za-z0-9 '\-]+")
 
-# Frozen set for O(1) lookup
+# Frozen set for O(1) lookup; members are interned so lookups against
+# interned tokens short-circuit on identity
 EN_STOP = frozenset(
-    {
+    sys.intern(word)
+    for word in {
         "the",
         "and",
         "for",
@@ -79,6 +96,11 @@ TUNISIAN_PATTERNS = (
     "gh",
 )
 
+# One alternation pattern so the token is scanned once in C instead of
+# once per substring in the tuple above; the patterns are plain literals,
+# so no escaping is needed
+TUNISIAN_PATTERN: Pattern = re.compile("|".join(TUNISIAN_PATTERNS))
+
 
 def extract_text(html: str) -> str:
     """Extract clean text from HTML.
@@ -89,28 +111,54 @@ def extract_text(html: str) -> str:
     Returns:
         Cleaned text content
     """
-    if not html:
+    if not html or not html.strip():
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+        return ""
 
     # Remove unwanted tags
-    for tag in soup(["script", "style", "nav", "footer", "noscript", "svg", "form", "iframe"]):
-        tag.decompose()
+    etree.strip_elements(tree, *STRIP_TAGS, with_tail=False)
 
     # Find main content container
-    container = soup.find(["article", "main"]) or soup.body or soup
-
-    # Extract text from relevant elements
+    container = next(tree.iter("article", "main"), None)
+    if container is None:
+        body = tree.find("body")
+        container = body if body is not None else tree
+
+    # Extract text from relevant elements. itertext is a C iterator and
+    # join consumes it directly; per-chunk stripping is left to the final
+    # whitespace normalization, which collapses runs anyway
     parts = []
-    for el in container.find_all(["h1", "h2", "h3", "p", "li", "blockquote"], recursive=True):
-        txt = el.get_text(" ", strip=True)
+    for el in container.iter(*TEXT_TAGS):
+        txt = " ".join(el.itertext()).strip()
         if txt:
             parts.append(txt)
 
-    # Join and normalize whitespace
-    text = "\n".join(parts)
-    return WHITESPACE_PATTERN.sub(" ", text).strip()
+    # Join and normalize whitespace; split()/join collapse runs in C
+    # without involving the regex engine
+    return " ".join("\n".join(parts).split())
+
+
+def extract_text_batch(htmls: list[str], max_workers: int | None = None) -> list[str]:
+    """Extract clean text from many HTML documents in parallel.
+
+    Documents are independent, so offline reprocessing jobs can spread
+    the parsing across cores; the chunksize amortizes the per-task
+    dispatch cost. Spiders handling one response at a time should keep
+    calling extract_text directly.
+
+    Args:
+        htmls: HTML strings to extract text from
+        max_workers: Worker process count (defaults to the executor's choice)
+
+    Returns:
+        Extracted text for each document, in input order
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(extract_text, htmls, chunksize=16))
 
 
 def split_sentences(text: str) -> list[str]:
@@ -126,14 +174,20 @@ def split_sentences(text: str) -> list[str]:
         return []
 
     sentences = SENTENCE_SPLIT_PATTERN.split(text)
-    return [s.strip() for s in sentences if s.strip()]
+    # Walrus keeps it to one strip per sentence instead of two
+    return [stripped for s in sentences if (stripped := s.strip())]
 
 
+@lru_cache(maxsize=16384)
 def _is_roman_tunisian_token(token: str) -> bool:
     """Check if token is likely romanized Tunisian.
 
+    Token frequencies are Zipfian, so a handful of tokens account for
+    most occurrences; memoizing on the (already lowercased) token string
+    means repeats skip the checks entirely.
+
     Args:
-        token: Token to check
+        token: Lowercased token to check
 
     Returns:
         True if token appears to be romanized Tunisian
@@ -146,7 +200,7 @@ def _is_roman_tunisian_token(token: str) -> bool:
         return True
 
     # Check for common Tunisian patterns
-    return any(pattern in token for pattern in TUNISIAN_PATTERNS)
+    return TUNISIAN_PATTERN.search(token) is not None
 
 
 def extract_tokens(text: str) -> tuple[list[str], list[str]]:
@@ -161,35 +215,80 @@ def extract_tokens(text: str) -> tuple[list[str], list[str]]:
     if not text:
         return [], []
 
-    # Extract Arabic tokens
-    arabic = ARABIC_PATTERN.findall(text)
-
-    # Extract and filter romanized tokens
-    roman_all = ROMAN_TOKEN_PATTERN.findall(text.lower())
-    romanized = [t for t in roman_all if _is_roman_tunisian_token(t)]
+    # One scan picks up both scripts; only the short roman matches are
+    # lowercased instead of copying the whole text through text.lower()
+    arabic: list[str] = []
+    romanized: list[str] = []
+
+    # Repeated tokens hit the predicate's memo cache, which beats
+    # re-evaluating the filter inline for Zipf-distributed text.
+    # Interning collapses each recurring token to one shared object, so
+    # downstream dict and set lookups compare by identity first.
+    is_roman = _is_roman_tunisian_token
+    intern = sys.intern
+
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group(1)
+        if token is not None:
+            arabic.append(intern(token))
+            continue
+        token = intern(match.group(2).lower())
+        if is_roman(token):
+            romanized.append(token)
 
     return arabic, romanized
 
 
-def build_vocab(freq: dict[str, int], samples: dict[str, dict]) -> list[dict]:
+class Sample:
+    """Script and example sentences recorded for one vocabulary token.
+
+    A slotted class instead of a per-token dict; vocabulary tracking keeps
+    one of these per unique token, so the smaller footprint adds up on
+    large crawls.
+    """
+
+    __slots__ = ("script", "examples")
+
+    def __init__(self, script: str, examples: list[str]):
+        self.script = script
+        self.examples = examples
+
+
+def build_vocab(
+    freq: dict[str, int], samples: dict[str, Sample | dict], top_k: int | None = None
+) -> list[dict]:
     """Build vocabulary JSON structure.
 
     Args:
         freq: Word frequency dictionary
-        samples: Word samples dictionary with script and examples
+        samples: Word samples keyed by token, as Sample objects or plain
+            dicts with script and examples
+        top_k: If set, keep only the K most frequent entries; nlargest
+            runs a K-sized heap instead of sorting every token
 
     Returns:
         List of vocabulary entries sorted by frequency
     """
+    if top_k is not None:
+        items = heapq.nlargest(top_k, freq.items(), key=itemgetter(1))
+    else:
+        items = sorted(freq.items(), key=itemgetter(1), reverse=True)
+
     vocab = []
-    for word, count in sorted(freq.items(), key=lambda x: x[1], reverse=True):
-        sample = samples.get(word, {})
+    for word, count in items:
+        sample = samples.get(word)
+        if sample is None:
+            script, examples = None, []
+        elif isinstance(sample, Sample):
+            script, examples = sample.script, sample.examples
+        else:
+            script, examples = sample.get("script"), sample.get("examples", [])
         vocab.append(
             {
                 "word": word,
                 "count": count,
-                "script": sample.get("script"),
-                "examples": sample.get("examples", []),
+                "script": script,
+                "examples": examples,
             }
         )
     return vocab
@@ -206,13 +305,17 @@ def extract_cards(text: str, url: str) -> list[dict[str, str]]:
         List of dicts with keys: source, url, english, arabic, roman
     """
     cards = []
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    lines = [stripped for line in text.split("\n") if (stripped := line.strip())]
 
     # Try to find triplets: English, Arabic, Romanized
     cards.extend(_extract_card_triplets(lines, url))
 
-    # Also try explicit "Word of the day:" patterns
-    if match := FLASHCARD_PATTERN.search(text):
+    # Also try explicit "Word of the day:" patterns. str.find prefilters
+    # for the literal sentinel so most documents skip the regex entirely,
+    # and the bounded window keeps the non-greedy groups from
+    # backtracking across the rest of the text when no triplet follows
+    idx = text.find("Word of the day:")
+    if idx != -1 and (match := FLASHCARD_PATTERN.search(text[idx : idx + 512])):
         en, ar, ro = match.groups()
         if TUNISIAN_DIGIT_PATTERN.search(ro):
             cards.append(_create_card_dict(url, en.strip(), ar.strip(), ro.strip()))
@@ -231,36 +334,36 @@ def _extract_card_triplets(lines: list[str], url: str) -> list[dict[str, str]]:
         List of card dictionaries
     """
     cards = []
-
-    for i in range(len(lines) - 2):
-        en, ar, ro = lines[i], lines[i + 1], lines[i + 2]
-
-        if _is_valid_card_triplet(en, ar, ro):
+    if len(lines) < 3:
+        return cards
+
+    # Windows overlap threefold, so each regex runs once per line here and
+    # the window loop below only reads the precomputed flags. The roman
+    # fullmatch is gated on the digit flag since it only matters for lines
+    # that already carry a Tunisian digit.
+    arabic_flags = [ARABIC_PATTERN.search(line) is not None for line in lines]
+    roman_flags = [
+        TUNISIAN_DIGIT_PATTERN.search(line) is not None
+        and ROMAN_LINE_PATTERN.fullmatch(line) is not None
+        for line in lines
+    ]
+
+    # zip drives the 3-wide window with C-level iteration instead of three
+    # index lookups per line
+    windows = zip(
+        lines,
+        islice(lines, 1, None),
+        islice(lines, 2, None),
+        islice(arabic_flags, 1, None),
+        islice(roman_flags, 2, None),
+    )
+    for en, ar, ro, ar_is_arabic, ro_is_roman in windows:
+        if len(en) >= 5 and len(ar) >= 2 and ro_is_roman and ar_is_arabic:
             cards.append(_create_card_dict(url, en, ar, ro))
 
     return cards
 
 
-def _is_valid_card_triplet(en: str, ar: str, ro: str) -> bool:
-    """Check if three lines form a valid flashcard triplet.
-
-    Args:
-        en: Potential English text
-        ar: Potential Arabic text
-        ro: Potential romanized text
-
-    Returns:
-        True if this is a valid card triplet
-    """
-    return (
-        len(en) >= 5
-        and len(ar) >= 2
-        and ARABIC_PATTERN.search(ar) is not None
-        and re.fullmatch(r"[A-Za-z0-9 '\-]+", ro) is not None
-        and TUNISIAN_DIGIT_PATTERN.search(ro) is not None
-    )
-
-
 def _create_card_dict(url: str, english: str, arabic: str, roman: str) -> dict[str, str]:
     """Create a card dictionary.
 